@@ -1,13 +1,17 @@
 import os
 import sys
 import logging
-from flask import Flask, render_template, request, redirect, url_for, send_from_directory, flash, jsonify
+from flask import Flask, Request, render_template, request, redirect, url_for, send_from_directory, flash, jsonify
 from werkzeug.utils import secure_filename
 from datetime import datetime
 import traceback
 import time
 import uuid
+import queue
+import tempfile
 import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 
 # Setup logging for tracking app activity and errors
 logging.basicConfig(
@@ -18,16 +22,38 @@ logger = logging.getLogger(__name__)
 
 # Try to import Transcriber module
 try:
-    from core.transcriber import convert_audio_to_wav, transcribe_audio, preload_models
+    from core.transcriber import convert_audio_to_wav, iter_transcribe_stream, preload_models, WHISPER_AVAILABLE
+    # faster-whisper itself is only imported when the first model loads
+    if not WHISPER_AVAILABLE:
+        raise ImportError("No module named 'faster_whisper'")
     TRANSCRIBER_AVAILABLE = True
     logger.info("Transcriber module loaded")
 except ImportError as e:
     logger.error(f"Failed to import transcriber: {e}")
     TRANSCRIBER_AVAILABLE = False
 
+# Try to import the remote (Replicate) transcriber backend
+try:
+    from core.transcriber_remote import transcribe_remote
+    REMOTE_TRANSCRIBER_AVAILABLE = True
+    logger.info("Remote transcriber module loaded")
+except ImportError as e:
+    logger.error(f"Failed to import remote transcriber: {e}")
+    REMOTE_TRANSCRIBER_AVAILABLE = False
+
+# Try to import the OpenVINO transcriber backend
+try:
+    from core.transcriber import decode_audio_to_array
+    from core.transcriber_openvino import transcribe_openvino
+    OPENVINO_TRANSCRIBER_AVAILABLE = True
+    logger.info("OpenVINO transcriber module loaded")
+except ImportError as e:
+    logger.error(f"Failed to import OpenVINO transcriber: {e}")
+    OPENVINO_TRANSCRIBER_AVAILABLE = False
+
 # Try to import Summarizer module
 try:
-    from core.summarizer import generate_meeting_minutes
+    from core.summarizer import generate_meeting_minutes_stream
     SUMMARIZER_AVAILABLE = True
     logger.info("Summarizer module loaded")
 except ImportError as e:
@@ -49,7 +75,15 @@ app.config['UPLOAD_FOLDER'] = 'data/uploaded_audio'   # where uploaded files are
 app.config['OUTPUT_FOLDER'] = 'outputs'               # where output files are saved
 app.config['ALLOWED_EXTENSIONS'] = {'mp3', 'wav', 'ogg', 'flac', 'm4a', 'mp4'}
 app.config['MAX_CONTENT_LENGTH'] = 1024 * 1024 * 1024 # 1GB upload limit
+app.config['JOB_WORKERS'] = int(os.environ.get('JOB_WORKERS', 2))          # audio jobs processed at once
+app.config['MAX_QUEUED_JOBS'] = int(os.environ.get('MAX_QUEUED_JOBS', 10)) # waiting jobs before uploads get 503
+app.config['MAX_JOBS'] = int(os.environ.get('MAX_JOBS', 500))              # finished jobs kept in memory
+app.config['WHISPER_SPEED_UP'] = os.environ.get('WHISPER_SPEED_UP', 'false').lower() == 'true'  # 2x audio before transcribing
+app.config['TRANSCRIBE_BACKEND'] = os.environ.get('TRANSCRIBE_BACKEND', 'local')  # 'local', 'replicate' or 'openvino'
+app.config['REPLICATE_API_TOKEN'] = os.environ.get('REPLICATE_API_TOKEN')
+app.config['OPENVINO_WHISPER_MODEL_DIR'] = os.environ.get('OPENVINO_WHISPER_MODEL_DIR')
 app.secret_key = 'supersecretkey'                     # secret key for sessions
+app.use_x_sendfile = os.environ.get('USE_X_SENDFILE', 'false').lower() == 'true'  # let a fronting server send downloads
 
 # Create necessary folders if not present
 os.makedirs(app.config['UPLOAD_FOLDER'], exist_ok=True)
@@ -57,12 +91,47 @@ os.makedirs(app.config['OUTPUT_FOLDER'], exist_ok=True)
 os.makedirs('temp_audio', exist_ok=True)
 os.makedirs('templates', exist_ok=True)
 
-# Dictionary to store job status and results
-job_data = {}
+# Request class that streams uploaded files straight into the upload folder,
+# so saving an upload is a rename instead of a second full copy
+class UploadRequest(Request):
+    def _get_file_stream(self, total_content_length, content_type, filename=None, content_length=None):
+        part = tempfile.NamedTemporaryFile(
+            'wb+', buffering=1024 * 1024, dir=app.config['UPLOAD_FOLDER'],
+            prefix='upload_', suffix='.part', delete=False
+        )
+        if not hasattr(self, '_upload_parts'):
+            self._upload_parts = []
+        self._upload_parts.append(part.name)
+        return part
+
+    def close(self):
+        # Remove partial files that were not moved into place by save_upload
+        super().close()
+        for part_path in getattr(self, '_upload_parts', []):
+            try:
+                os.remove(part_path)
+            except OSError:
+                pass
+
+app.request_class = UploadRequest
+
+# Job status and results, oldest first; every access goes through job_lock
+job_data = OrderedDict()
+job_lock = threading.Lock()
+
+# Bounded pool for audio jobs; extra uploads wait in its queue
+JOB_POOL = ThreadPoolExecutor(max_workers=app.config['JOB_WORKERS'], thread_name_prefix='job')
+
+# Shared pool so the three exports of a job run side by side
+EXPORT_POOL = ThreadPoolExecutor(max_workers=3, thread_name_prefix='export')
+
+# Frozen copy of the allowed extensions for upload checks
+ALLOWED_EXTENSIONS = frozenset(app.config['ALLOWED_EXTENSIONS'])
 
 # Check if uploaded file is allowed
 def allowed_file(filename):
-    return '.' in filename and filename.rsplit('.', 1)[1].lower() in app.config['ALLOWED_EXTENSIONS']
+    _, dot, extension = filename.rpartition('.')
+    return bool(dot) and extension.lower() in ALLOWED_EXTENSIONS
 
 # Handle large file upload error
 @app.errorhandler(413)
@@ -87,7 +156,7 @@ def index():
 @app.route('/processing')
 def processing():
     job_id = request.args.get('job_id')
-    if not job_id or job_id not in job_data:
+    if not job_id or get_job(job_id) is None:
         flash('Invalid job ID')
         return redirect(url_for('index'))
     return render_template('processing.html', job_id=job_id)
@@ -95,15 +164,73 @@ def processing():
 # API route to get job progress
 @app.route('/job_status/<job_id>')
 def job_status(job_id):
-    return jsonify(job_data.get(job_id, {"status": "not_found"}))
+    return jsonify(get_job(job_id) or {"status": "not_found"})
+
+# Return a snapshot of a job, or None if it is unknown or was evicted
+def get_job(job_id):
+    with job_lock:
+        job = job_data.get(job_id)
+        return dict(job) if job is not None else None
+
+# Register a new job, evicting the oldest finished jobs beyond MAX_JOBS
+def add_job(job_id, info):
+    with job_lock:
+        job_data[job_id] = info
+        excess = len(job_data) - app.config['MAX_JOBS']
+        if excess > 0:
+            finished = [jid for jid, job in job_data.items()
+                        if job.get("status") in ("completed", "error")]
+            for jid in finished[:excess]:
+                del job_data[jid]
+
+# Count jobs still waiting for a worker
+def count_queued_jobs():
+    with job_lock:
+        return sum(1 for job in job_data.values() if job.get("status") == "uploaded")
+
+# Function to update job status; extra keyword arguments are stored on the job too
+def update_job_status(job_id, status, progress=None, step=None, **fields):
+    with job_lock:
+        job = job_data.get(job_id)
+        if job is None:
+            return
+        job["status"] = status
+        if progress is not None:
+            job["progress"] = progress
+        if step is not None:
+            job["step"] = step
+        job.update(fields)
+
+# Push transcript text into the queue as segments are produced; None marks the end
+# and a transcription error is queued just before it. Setting stop ends
+# transcription early, e.g. when building the minutes failed
+def produce_transcript_segments(job_id, audio, segment_queue, stop):
+    try:
+        if app.config['TRANSCRIBE_BACKEND'] == 'replicate':
+            segments = transcribe_remote(audio, app.config['REPLICATE_API_TOKEN'])
+        elif app.config['TRANSCRIBE_BACKEND'] == 'openvino':
+            segments = transcribe_openvino(audio, app.config['OPENVINO_WHISPER_MODEL_DIR'], language="en")
+        else:
+            segments = iter_transcribe_stream(audio, model_size="base", language="en",
+                                              speed_up=app.config['WHISPER_SPEED_UP'])
+        for seg in segments:
+            # Leaving the loop drops the generator, which stops ffmpeg and the model
+            if stop.is_set():
+                return
+            if seg.get("text"):
+                segment_queue.put(seg["text"])
+        update_job_status(job_id, "processing", 75, "Generating minutes")
+    except Exception as e:
+        segment_queue.put(e)
+    finally:
+        segment_queue.put(None)
 
-# Function to update job status
-def update_job_status(job_id, status, progress=None, step=None):
-    job_data[job_id]["status"] = status
-    if progress is not None:
-        job_data[job_id]["progress"] = progress
-    if step is not None:
-        job_data[job_id]["step"] = step
+# Transcript text from the producer's queue; re-raises a queued transcription error
+def queued_segments(segment_queue):
+    for item in iter(segment_queue.get, None):
+        if isinstance(item, Exception):
+            raise item
+        yield item
 
 # Background task to process audio file
 def process_audio_file(job_id, filepath, filename):
@@ -113,25 +240,45 @@ def process_audio_file(job_id, filepath, filename):
         start_time = time.time()
         logger.info(f"[Job {job_id}] Processing {filename}")
 
-        # Step 1: Convert audio to wav
+        if app.config['TRANSCRIBE_BACKEND'] == 'replicate' and not REMOTE_TRANSCRIBER_AVAILABLE:
+            raise Exception("Remote transcriber backend is not available")
+        if app.config['TRANSCRIBE_BACKEND'] == 'openvino' and not OPENVINO_TRANSCRIBER_AVAILABLE:
+            raise Exception("OpenVINO transcriber backend is not available")
+
+        # Step 1: The remote backend needs a WAV file to upload and OpenVINO takes
+        # decoded samples; the local model decodes the upload itself while it transcribes
         update_job_status(job_id, "processing", 20, "Converting audio")
-        wav_filepath = convert_audio_to_wav(filepath, output_dir='temp_audio')
+        if app.config['TRANSCRIBE_BACKEND'] == 'replicate':
+            wav_filepath = convert_audio_to_wav(filepath, output_dir='temp_audio',
+                                                speed_up=app.config['WHISPER_SPEED_UP'])
+            audio = wav_filepath
+        elif app.config['TRANSCRIBE_BACKEND'] == 'openvino':
+            audio = decode_audio_to_array(filepath, speed_up=app.config['WHISPER_SPEED_UP'])
+        else:
+            audio = filepath
 
-        # Step 2: Transcribe audio to text
+        # Steps 2-5: Transcribe in a producer thread while the minutes are built
+        # from the segments as they arrive
         update_job_status(job_id, "processing", 30, "Transcribing audio")
-        raw_transcript = transcribe_audio(wav_filepath, model_size="base", language="en")
-       
-        # Step 3: Join all transcribed text
-        update_job_status(job_id, "processing", 60, "Processing transcript")
-        full_text = " ".join([seg["text"].strip() for seg in raw_transcript if seg.get("text")])
+        segment_queue = queue.Queue()  # unbounded, so the producer never blocks on a failed consumer
+        stop_producer = threading.Event()
+        producer = threading.Thread(
+            target=produce_transcript_segments,
+            args=(job_id, audio, segment_queue, stop_producer),
+            daemon=True
+        )
+        producer.start()
+        try:
+            minutes, full_text = generate_meeting_minutes_stream(queued_segments(segment_queue))
+        finally:
+            # The producer has finished unless the minutes failed; then stop it and wait,
+            # so transcription never outlives the job's JOB_POOL slot
+            stop_producer.set()
+            producer.join()
        
-        # Step 4: Check if valid speech found
+        # Check if valid speech found
         if not full_text or len(full_text) < 10:
             raise Exception("No speech detected in audio")
-
-        # Step 5: Generate meeting summary and minutes
-        update_job_status(job_id, "processing", 75, "Generating minutes")
-        minutes = generate_meeting_minutes(full_text)
        
         # Store all results
         results = {
@@ -148,9 +295,13 @@ def process_audio_file(job_id, filepath, filename):
         safe_filename = secure_filename(os.path.splitext(filename)[0])
         output_basename = f"{timestamp}_{safe_filename}"
        
-        export_to_text(results, os.path.join(app.config['OUTPUT_FOLDER'], f"{output_basename}.txt"))
-        export_to_word(results, os.path.join(app.config['OUTPUT_FOLDER'], f"{output_basename}.docx"))
-        export_to_pdf(results, os.path.join(app.config['OUTPUT_FOLDER'], f"{output_basename}.pdf"))
+        export_futures = [
+            EXPORT_POOL.submit(export_to_text, results, os.path.join(app.config['OUTPUT_FOLDER'], f"{output_basename}.txt")),
+            EXPORT_POOL.submit(export_to_word, results, os.path.join(app.config['OUTPUT_FOLDER'], f"{output_basename}.docx")),
+            EXPORT_POOL.submit(export_to_pdf, results, os.path.join(app.config['OUTPUT_FOLDER'], f"{output_basename}.pdf"))
+        ]
+        for future in export_futures:
+            future.result()  # re-raises any export error
 
         # Step 7: Delete temp files
         for file_path in [wav_filepath, filepath]:
@@ -162,22 +313,22 @@ def process_audio_file(job_id, filepath, filename):
 
         # Step 8: Save results and time taken
         total_time = time.time() - start_time
-        job_data[job_id]['results'] = {
-            'results': results,
-            'text_file': f"{output_basename}.txt",
-            'word_file': f"{output_basename}.docx",
-            'pdf_file': f"{output_basename}.pdf",
-            'processing_time': f"{total_time:.2f}s"
-        }
-       
-        update_job_status(job_id, "completed", 100, "Complete")
-        job_data[job_id]["results_url"] = f"/results/{job_id}"
+        update_job_status(
+            job_id, "completed", 100, "Complete",
+            results={
+                'results': results,
+                'text_file': f"{output_basename}.txt",
+                'word_file': f"{output_basename}.docx",
+                'pdf_file': f"{output_basename}.pdf",
+                'processing_time': f"{total_time:.2f}s"
+            },
+            results_url=f"/results/{job_id}"
+        )
 
     except Exception as e:
         # If any error occurs, log and mark job as failed
         logger.error(f"[Job {job_id}] Error: {str(e)}")
-        update_job_status(job_id, "error", 0, "Error")
-        job_data[job_id]["message"] = str(e)
+        update_job_status(job_id, "error", 0, "Error", message=str(e))
        
         for file_path in [wav_filepath, filepath]:
             if file_path and os.path.exists(file_path):
@@ -186,6 +337,15 @@ def process_audio_file(job_id, filepath, filename):
                 except:
                     pass
 
+# Move an uploaded file to its final path; streamed uploads are already on disk
+def save_upload(file, filepath):
+    part_path = getattr(file.stream, 'name', None)
+    if isinstance(part_path, str) and part_path.endswith('.part'):
+        file.stream.close()
+        os.replace(part_path, filepath)
+    else:
+        file.save(filepath)
+
 # Route to handle file uploads
 @app.route('/upload', methods=['POST'])
 def upload_file():
@@ -200,23 +360,26 @@ def upload_file():
 
     # If file type is allowed, save it
     if file and allowed_file(file.filename):
+        # Refuse new work while too many jobs are waiting for a worker
+        if count_queued_jobs() >= app.config['MAX_QUEUED_JOBS']:
+            flash('Server is busy. Please try again in a few minutes.')
+            return render_template('index.html'), 503
+
         filename = secure_filename(file.filename)
         filepath = os.path.join(app.config['UPLOAD_FOLDER'], filename)
-        file.save(filepath)
+        save_upload(file, filepath)
        
         # Create new job entry
         job_id = str(uuid.uuid4())
-        job_data[job_id] = {
+        add_job(job_id, {
             "status": "uploaded",
             "progress": 10,
             "step": "File uploaded",
             "filename": filename
-        }
+        })
        
-        # Start background thread for processing
-        thread = threading.Thread(target=process_audio_file, args=(job_id, filepath, filename))
-        thread.daemon = True
-        thread.start()
+        # Queue the job on the worker pool
+        JOB_POOL.submit(process_audio_file, job_id, filepath, filename)
        
         return redirect(url_for('processing', job_id=job_id))
     else:
@@ -226,12 +389,11 @@ def upload_file():
 # Route to show results page
 @app.route('/results/<job_id>')
 def results(job_id):
-    if job_id not in job_data:
+    job_info = get_job(job_id)
+    if job_info is None:
         flash('Results not found')
         return redirect(url_for('index'))
    
-    job_info = job_data[job_id]
-   
     if job_info.get('status') == 'error':
         flash(f'Processing failed: {job_info.get("message")}')
         return redirect(url_for('index'))
@@ -254,7 +416,12 @@ def results(job_id):
 @app.route('/download/<filename>')
 def download_file(filename):
     try:
-        return send_from_directory(app.config['OUTPUT_FOLDER'], filename, as_attachment=True)
+        # Export names are timestamped and never rewritten, so they can be cached;
+        # conditional/etag let re-downloads answer 304 Not Modified
+        return send_from_directory(
+            app.config['OUTPUT_FOLDER'], filename, as_attachment=True,
+            conditional=True, etag=True, max_age=86400
+        )
     except Exception as e:
         logger.error(f"Download error: {e}")
         flash(f"Download failed: {str(e)}")
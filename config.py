@@ -8,8 +8,28 @@ class Config:
     ALLOWED_EXTENSIONS = {'mp3', 'wav', 'ogg', 'flac', 'm4a', 'mp4'}
     MAX_CONTENT_LENGTH = 1024 * 1024 * 1024  # 1GB
     
+    # Background job settings
+    JOB_WORKERS = int(os.environ.get('JOB_WORKERS', 2))
+    MAX_QUEUED_JOBS = int(os.environ.get('MAX_QUEUED_JOBS', 10))
+    MAX_JOBS = int(os.environ.get('MAX_JOBS', 500))
+    
+    # Hand file downloads to the fronting web server via X-Sendfile
+    USE_X_SENDFILE = os.environ.get('USE_X_SENDFILE', 'false').lower() == 'true'
+    
     # Whisper settings
     WHISPER_MODEL_SIZE = os.environ.get('WHISPER_MODEL_SIZE', 'base')
+    WHISPER_SPEED_UP = os.environ.get('WHISPER_SPEED_UP', 'false').lower() == 'true'
+    WHISPER_MODEL_DIR = os.environ.get('WHISPER_MODEL_DIR')
+    WHISPER_DEVICE = os.environ.get('WHISPER_DEVICE')              # 'cuda' or 'cpu'; detected if unset
+    WHISPER_COMPUTE_TYPE = os.environ.get('WHISPER_COMPUTE_TYPE')  # e.g. 'float16', 'int8'; picked per device if unset
+    
+    # Transcription backend: 'local' Whisper, hosted 'replicate' or Intel 'openvino'
+    TRANSCRIBE_BACKEND = os.environ.get('TRANSCRIBE_BACKEND', 'local')
+    REPLICATE_API_TOKEN = os.environ.get('REPLICATE_API_TOKEN')
+    REPLICATE_WHISPER_VERSION = os.environ.get('REPLICATE_WHISPER_VERSION')
+    OPENVINO_WHISPER_MODEL_DIR = os.environ.get('OPENVINO_WHISPER_MODEL_DIR')
+    OPENVINO_DEVICE = os.environ.get('OPENVINO_DEVICE')        # 'CPU', 'GPU' or 'NPU'; GPU if present when unset
+    OPENVINO_CACHE_DIR = os.environ.get('OPENVINO_CACHE_DIR')  # compiled model cache; ~/.cache/whisper_ov if unset
     
     # Deployment settings
     DEPLOYMENT_TESTING = os.environ.get('DEPLOYMENT_TESTING', 'false').lower() == 'true'
@@ -2,32 +2,35 @@
 from docx import Document
 from docx.shared import Inches as DocxInches, Pt
 from docx.enum.text import WD_ALIGN_PARAGRAPH
-from reportlab.lib.pagesizes import letter
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, PageBreak
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from reportlab.lib.enums import TA_CENTER, TA_LEFT
-from reportlab.lib.units import inch
+from fpdf import FPDF
 import os
 from datetime import datetime
 
+inch = 72  # PDF points per inch
+
+def _pdf_text(text):
+    """Make text safe for the built-in PDF fonts, which only cover Windows-1252."""
+    return text.encode('windows-1252', 'replace').decode('windows-1252')
+
 def export_to_text(minutes_data, output_filepath):
     """Exports minutes to a plain text file."""
     try:
+        content = (
+            "--- Meeting Minutes ---\n\n"
+            f"Date: {datetime.now().strftime('%Y-%m-%d %H:%M')}\n\n"
+            "Meeting Summary:\n"
+            f"{minutes_data.get('summary', 'N/A')}\n\n"
+            "Key Decisions:\n"
+            f"{minutes_data.get('decisions', 'N/A')}\n\n"
+            "Action Items:\n"
+            f"{minutes_data.get('action_items', 'N/A')}\n\n"
+            "Important Deadlines:\n"
+            f"{minutes_data.get('deadlines', 'N/A')}\n\n"
+        )
+
+        # Single write instead of one per line
         with open(output_filepath, 'w', encoding='utf-8') as f:
-            f.write("--- Meeting Minutes ---\n\n")
-            f.write(f"Date: {datetime.now().strftime('%Y-%m-%d %H:%M')}\n\n")
-
-            f.write("Meeting Summary:\n")
-            f.write(minutes_data.get('summary', 'N/A') + "\n\n")
-
-            f.write("Key Decisions:\n")
-            f.write(minutes_data.get('decisions', 'N/A') + "\n\n")
-
-            f.write("Action Items:\n")
-            f.write(minutes_data.get('action_items', 'N/A') + "\n\n")
-
-            f.write("Important Deadlines:\n")
-            f.write(minutes_data.get('deadlines', 'N/A') + "\n\n")
+            f.write(content)
 
         print(f"Minutes exported to {output_filepath}")
         return output_filepath
@@ -73,51 +76,55 @@ def export_to_word(minutes_data, output_filepath):
         raise
 
 def export_to_pdf(minutes_data, output_filepath):
-    """Exports minutes to a PDF file using ReportLab."""
+    """Exports minutes to a PDF file using fpdf2."""
     try:
-        doc = SimpleDocTemplate(output_filepath, pagesize=letter)
-        styles = getSampleStyleSheet()
-        story = []
-
-        # Custom styles
-        h0_style = ParagraphStyle(name='Title', fontSize=24, leading=28, alignment=TA_CENTER,
-                                  fontName='Helvetica-Bold')
-        h1_style = ParagraphStyle(name='Heading1', fontSize=18, leading=22, alignment=TA_LEFT,
-                                  fontName='Helvetica-Bold')
-        normal_style = ParagraphStyle(name='Normal', fontSize=10, leading=12, alignment=TA_LEFT,
-                                      fontName='Helvetica')
+        # Letter page with 1 inch margins, sized in points
+        pdf = FPDF(unit='pt', format='letter')
+        pdf.core_fonts_encoding = 'windows-1252'
+        pdf.set_margins(inch, inch, inch)
+        pdf.set_auto_page_break(True, margin=inch)
+        pdf.add_page()
 
         # Title
-        story.append(Paragraph("Meeting Minutes", h0_style))
-        story.append(Spacer(1, 0.2 * inch))
-        story.append(Paragraph(f"Date: {datetime.now().strftime('%Y-%m-%d %H:%M')}", styles['Normal']))
-        story.append(Spacer(1, 0.3 * inch))
+        pdf.set_font('Helvetica', 'B', 24)
+        pdf.cell(0, 28, "Meeting Minutes", align='C', new_x='LMARGIN', new_y='NEXT')
+        pdf.ln(0.2 * inch)
+        pdf.set_font('Helvetica', '', 10)
+        pdf.cell(0, 12, f"Date: {datetime.now().strftime('%Y-%m-%d %H:%M')}", new_x='LMARGIN', new_y='NEXT')
+        pdf.ln(0.3 * inch)
 
         # Summary
-        story.append(Paragraph("1. Meeting Summary", h1_style))
-        story.append(Spacer(1, 0.1 * inch))
-        story.append(Paragraph(minutes_data.get('summary', 'N/A'), normal_style))
-        story.append(Spacer(1, 0.2 * inch))
+        pdf.set_font('Helvetica', 'B', 18)
+        pdf.cell(0, 22, "1. Meeting Summary", new_x='LMARGIN', new_y='NEXT')
+        pdf.ln(0.1 * inch)
+        pdf.set_font('Helvetica', '', 10)
+        pdf.multi_cell(0, 12, _pdf_text(minutes_data.get('summary', 'N/A')), new_x='LMARGIN', new_y='NEXT')
+        pdf.ln(0.2 * inch)
 
         # Decisions
-        story.append(Paragraph("2. Key Decisions", h1_style))
-        story.append(Spacer(1, 0.1 * inch))
-        story.append(Paragraph(minutes_data.get('decisions', 'N/A'), normal_style))
-        story.append(Spacer(1, 0.2 * inch))
+        pdf.set_font('Helvetica', 'B', 18)
+        pdf.cell(0, 22, "2. Key Decisions", new_x='LMARGIN', new_y='NEXT')
+        pdf.ln(0.1 * inch)
+        pdf.set_font('Helvetica', '', 10)
+        pdf.multi_cell(0, 12, _pdf_text(minutes_data.get('decisions', 'N/A')), new_x='LMARGIN', new_y='NEXT')
+        pdf.ln(0.2 * inch)
 
         # Action Items
-        story.append(Paragraph("3. Action Items", h1_style))
-        story.append(Spacer(1, 0.1 * inch))
-        story.append(Paragraph(minutes_data.get('action_items', 'N/A'), normal_style))
-        story.append(Spacer(1, 0.2 * inch))
+        pdf.set_font('Helvetica', 'B', 18)
+        pdf.cell(0, 22, "3. Action Items", new_x='LMARGIN', new_y='NEXT')
+        pdf.ln(0.1 * inch)
+        pdf.set_font('Helvetica', '', 10)
+        pdf.multi_cell(0, 12, _pdf_text(minutes_data.get('action_items', 'N/A')), new_x='LMARGIN', new_y='NEXT')
+        pdf.ln(0.2 * inch)
 
         # Deadlines
-        story.append(Paragraph("4. Important Deadlines", h1_style))
-        story.append(Spacer(1, 0.1 * inch))
-        story.append(Paragraph(minutes_data.get('deadlines', 'N/A'), normal_style))
-        story.append(Spacer(1, 0.3 * inch))
+        pdf.set_font('Helvetica', 'B', 18)
+        pdf.cell(0, 22, "4. Important Deadlines", new_x='LMARGIN', new_y='NEXT')
+        pdf.ln(0.1 * inch)
+        pdf.set_font('Helvetica', '', 10)
+        pdf.multi_cell(0, 12, _pdf_text(minutes_data.get('deadlines', 'N/A')), new_x='LMARGIN', new_y='NEXT')
 
-        doc.build(story)
+        pdf.output(output_filepath)
         print(f"Minutes exported to {output_filepath}")
         return output_filepath
     except Exception as e:
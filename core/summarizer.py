@@ -1,6 +1,11 @@
 import os
 import re
+import json
+import heapq
+import hashlib
 import logging
+import threading
+from bisect import bisect_right
 from typing import Dict, List
 
 logger = logging.getLogger(__name__)
@@ -22,6 +27,192 @@ if NLTK_AVAILABLE:
         except Exception:
             NLTK_AVAILABLE = False
 
+try:
+    import hyperscan
+    HYPERSCAN_AVAILABLE = True
+    logger.info("Hyperscan loaded successfully")
+except ImportError:
+    HYPERSCAN_AVAILABLE = False
+
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+_IMPORTANT_KEYWORDS = [
+    'decided', 'agreed', 'concluded', 'will', 'should', 'must',
+    'important', 'critical', 'key', 'main', 'primary',
+    'action', 'deadline', 'by', 'before', 'need to', 'have to',
+    'summary', 'conclusion', 'result', 'outcome',
+    'goal', 'objective', 'priority', 'focus'
+]
+
+_KEYWORD_AUTOMATON = None
+if AHOCORASICK_AVAILABLE:
+    _KEYWORD_AUTOMATON = ahocorasick.Automaton()
+    for _keyword in _IMPORTANT_KEYWORDS:
+        _KEYWORD_AUTOMATON.add_word(_keyword, _keyword)
+    _KEYWORD_AUTOMATON.make_automaton()
+
+# Minutes are cached on disk by transcript hash; bump the version whenever
+# extraction changes so stale entries are ignored
+MINUTES_CACHE_DIR = os.environ.get('MINUTES_CACHE_DIR', os.path.join('cache', 'minutes'))
+_MINUTES_CACHE_VERSION = 1
+
+_SENT_SPLIT = re.compile(r'(?<=[.!?])\s+')
+_DIGIT_RE = re.compile(r'\d')
+
+_DECISION_PATTERNS = [re.compile(p, re.IGNORECASE) for p in [
+    r'\b(decided|agreed|concluded|determined|resolved|settled)\b',
+    r'\b(we will|we\'ll|let\'s|we should|we must)\b',
+    r'\b(approved|accepted|confirmed|finalized|committed to)\b',
+    r'\b(going with|moving forward with|proceeding with)\b',
+    r'\b(final decision|unanimous|consensus|voted to)\b',
+    r'\b(decision:|conclusion:)\s*',
+    r'\b(plan to|going to|will be|shall)\b',
+    r'\b(selected|chose|picked|opted for)\b',
+    r'\b(scheduled|arranged|organized)\b',
+    r'\b(changed|updated|modified)\b',
+    r'\b(adopted|implemented|established)\b',
+]]
+
+_ACTION_PATTERNS = [re.compile(p, re.IGNORECASE) for p in [
+    r'([A-Z][a-z]+(?:\s+[A-Z][a-z]+)?)\s+(?:will|should|needs? to|has to|must|is going to)\s+([^.!?]{10,})',
+    r'([A-Z][a-z]+(?:\s+[A-Z][a-z]+)?)\s+(?:is|will be)\s+(?:responsible for|in charge of|handling)\s+([^.!?]{10,})',
+    r'(?:action item|task|todo|to-do|assignment):\s*([^.!?]{10,})',
+    r'(?:please|can you|could you|would you)\s+([^.!?]{10,})',
+    r'\b(?:we|someone|somebody)\s+(?:need to|have to|must|should)\s+([^.!?]{10,})',
+]]
+
+# Enhanced deadline patterns with specific dates and times
+_DEADLINE_PATTERNS = [re.compile(p, re.IGNORECASE) for p in [
+    # Original patterns
+    r'(?:by|before|until|no later than|due)\s+([A-Z][a-z]+day(?:\s+\w+)*|(?:the\s+)?\d{1,2}(?:st|nd|rd|th)?(?:\s+of)?\s+\w+|\d{1,2}/\d{1,2})',
+    r'(?:deadline|due date)(?:\s+is)?:?\s+([\w\s,]+)',
+    r'(?:complete|finish|submit|deliver|send)\s+(?:by|before)\s+([\w\s,]+)',
+    r'\b(tomorrow|today|tonight|this week|next week|this month|next month|end of (?:week|month|quarter|year))\b',
+    r'(?:in|within)\s+(\d+\s+(?:days?|weeks?|months?))',
+
+    # NEW PATTERNS FOR SPECIFIC DATES
+    # Date formats: DD/MM/YYYY, DD-MM-YYYY, MM/DD/YYYY
+    r'\b\d{1,2}[/-]\d{1,2}[/-]\d{2,4}\b',
+    # Date formats: Month DD, YYYY (e.g., May 18, 2025)
+    r'\b(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]* \d{1,2}(?:st|nd|rd|th)?,? \d{4}\b',
+    # Date formats: DD Month YYYY (e.g., 18 May 2025)
+    r'\b\d{1,2}(?:st|nd|rd|th)? (?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]* \d{4}\b',
+
+    # NEW PATTERNS FOR TIMES
+    # Time formats: HH:MM (e.g., 5:00, 17:30)
+    r'\b\d{1,2}:\d{2}\b',
+    # Time formats: HH:MM AM/PM (e.g., 5:00 PM)
+    r'\b\d{1,2}:\d{2}\s*(?:AM|PM|am|pm)\b',
+
+    # COMBINED DATE AND TIME
+    # Date and time together (e.g., 18/5/2025 at 5:00)
+    r'\b\d{1,2}[/-]\d{1,2}[/-]\d{2,4}\s+(?:at\s+)?\d{1,2}:\d{2}(?:\s*(?:AM|PM|am|pm))?\b',
+    # Month DD, YYYY at HH:MM (e.g., May 18, 2025 at 5:00 PM)
+    r'\b(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]* \d{1,2}(?:st|nd|rd|th)?,? \d{4}\s+(?:at\s+)?\d{1,2}:\d{2}(?:\s*(?:AM|PM|am|pm))?\b',
+]]
+
+# All deadline patterns in one alternation, so the re path makes one pass per sentence
+_DEADLINE_ANY = re.compile('|'.join(f'(?:{p.pattern})' for p in _DEADLINE_PATTERNS), re.IGNORECASE)
+
+# Expanded time indicators; matched as plain substrings of the lowercased sentence
+_TIME_INDICATORS = [
+    'deadline', 'due', 'by', 'before', 'until', 'asap', 'urgent',
+    'priority', 'immediately', 'soon', 'quickly', 'tomorrow', 'today',
+    'week', 'month', 'quarter', 'year',
+    # NEW INDICATORS
+    'at', 'on', 'date', 'time', 'schedule', 'appointment'
+]
+_TIME_INDICATOR_RE = re.compile('|'.join(re.escape(i) for i in _TIME_INDICATORS))
+
+_CLEAN_WS = re.compile(r'\s+')
+# Leading timestamp, speaker tag, upper-case label and time range, each stripped
+# at most once and in this order; only the speaker tag is case-insensitive
+_CLEAN_LEAD = re.compile(
+    r'^(?:\[?\d+:\d+:\d+\]?\s*)?'
+    r'(?i:SPEAKER_\d+:\s*)?'
+    r'(?:[A-Z\s]+:\s*)?'
+    r'(?:\[\d+\.\d+-\d+\.\d+\]\s*)?'
+)
+
+def _build_hs_database(patterns):
+    db = hyperscan.Database()
+    db.compile(
+        expressions=[p.pattern.encode('ascii') for p in patterns],
+        ids=list(range(len(patterns))),
+        elements=len(patterns),
+        flags=hyperscan.HS_FLAG_CASELESS,
+    )
+    return db
+
+_DECISION_DB = _ACTION_DB = _DEADLINE_DB = None
+_HS_LOCK = threading.Lock()
+
+if HYPERSCAN_AVAILABLE:
+    try:
+        _DECISION_DB = _build_hs_database(_DECISION_PATTERNS)
+        _ACTION_DB = _build_hs_database(_ACTION_PATTERNS)
+        _DEADLINE_DB = _build_hs_database(_DEADLINE_PATTERNS)
+    except hyperscan.HyperscanError as e:
+        logger.warning(f"Hyperscan compile failed, using re fallback: {e}")
+        _DECISION_DB = _ACTION_DB = _DEADLINE_DB = None
+
+def _split_sentences(text):
+    return sent_tokenize(text) if NLTK_AVAILABLE else _SENT_SPLIT.split(text)
+
+def _matching_sentences(sentences, patterns, database):
+    """Return the indices of sentences matched by at least one pattern."""
+    # Hyperscan's \b, \w and \s are ASCII-only, so non-ASCII transcripts
+    # take the re path to keep results identical.
+    if database is None or not all(sentence.isascii() for sentence in sentences):
+        return {idx for idx, sentence in enumerate(sentences)
+                if any(pattern.search(sentence) for pattern in patterns)}
+
+    # Sentences are joined with '.', which none of the patterns can consume,
+    # so every hit falls inside a single sentence.
+    encoded = [sentence.encode('ascii') for sentence in sentences]
+    starts = []
+    offset = 0
+    for chunk in encoded:
+        starts.append(offset)
+        offset += len(chunk) + 1
+
+    hits = set()
+
+    def on_match(pattern_id, start, end, flags, context):
+        hits.add(bisect_right(starts, end - 1) - 1)
+
+    with _HS_LOCK:
+        database.scan(b'.'.join(encoded), match_event_handler=on_match)
+    return hits
+
+def _minutes_cache_path(cleaned_text):
+    digest = hashlib.sha256(cleaned_text.encode('utf-8')).hexdigest()
+    return os.path.join(MINUTES_CACHE_DIR, f"v{_MINUTES_CACHE_VERSION}_{digest}.json")
+
+def _load_cached_minutes(cleaned_text):
+    try:
+        with open(_minutes_cache_path(cleaned_text), 'r', encoding='utf-8') as f:
+            minutes = json.load(f)
+        logger.info("Minutes cache hit")
+        return minutes
+    except (OSError, ValueError):
+        return None
+
+def _store_cached_minutes(cleaned_text, minutes):
+    cache_path = _minutes_cache_path(cleaned_text)
+    tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(MINUTES_CACHE_DIR, exist_ok=True)
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(minutes, f)
+        os.replace(tmp_path, cache_path)
+    except OSError as e:
+        logger.warning(f"Could not write minutes cache: {e}")
+
 def generate_meeting_minutes(full_text):
     cleaned_text = full_text.strip()
     
@@ -33,93 +224,147 @@ def generate_meeting_minutes(full_text):
             "deadlines": "No transcript text provided."
         }
 
+    cached = _load_cached_minutes(cleaned_text)
+    if cached is not None:
+        return cached
+
     logger.info(f"Processing transcript: {len(cleaned_text)} chars")
     
-    summary = generate_summary(cleaned_text)
-    decisions = extract_decisions(cleaned_text)
-    action_items = extract_action_items(cleaned_text)
-    deadlines = extract_deadlines(cleaned_text)
+    # Tokenize once and share the sentences between all extractors
+    sentences = _split_sentences(cleaned_text)
+    sentences_lower = [s.lower() for s in sentences]
     
-    return {
+    summary = generate_summary(cleaned_text, sentences)
+    decisions = extract_decisions(sentences, sentences_lower)
+    action_items = extract_action_items(sentences)
+    deadlines = extract_deadlines(sentences, sentences_lower)
+    
+    minutes = {
         "summary": format_text(summary),
         "decisions": format_list(decisions, "decision"),
         "action_items": format_list(action_items, "action item"),
         "deadlines": format_list(deadlines, "deadline")
     }
+    _store_cached_minutes(cleaned_text, minutes)
+    return minutes
+
+def generate_meeting_minutes_stream(text_chunks):
+    """Build minutes from transcript text that arrives in pieces.
+
+    Decisions, action items and deadlines are extracted from each sentence as
+    soon as it is complete, so this work overlaps with transcription; only the
+    summary, which ranks sentences against the whole transcript, waits for the
+    end. Returns ``(minutes, full_text)``, where minutes is identical to
+    ``generate_meeting_minutes(full_text)``.
+    """
+    pieces = []
+    all_sentences = []
+    decisions, action_items, deadlines = [], [], []
+    pending = ""
+
+    def extract(sentences):
+        sentences_lower = [s.lower() for s in sentences]
+        all_sentences.extend(sentences)
+        decisions.extend(extract_decisions(sentences, sentences_lower))
+        action_items.extend(extract_action_items(sentences))
+        deadlines.extend(extract_deadlines(sentences, sentences_lower))
 
-def generate_summary(text):
+    for chunk in text_chunks:
+        if not chunk:
+            continue
+        chunk = chunk.strip()
+        pieces.append(chunk)
+        pending = f"{pending} {chunk}" if pending else chunk
+        sentences = _split_sentences(pending)
+        # The last sentence may continue in the next chunk
+        if len(sentences) > 1:
+            extract(sentences[:-1])
+            pending = sentences[-1]
+
+    full_text = " ".join(pieces)
+    cleaned_text = full_text.strip()
+    if not cleaned_text:
+        return generate_meeting_minutes(cleaned_text), full_text
+    cached = _load_cached_minutes(cleaned_text)
+    if cached is not None:
+        return cached, full_text
+    if pending.strip():
+        extract([pending])
+
+    logger.info(f"Processing transcript: {len(cleaned_text)} chars")
+
+    summary = generate_summary(cleaned_text, all_sentences)
+    minutes = {
+        "summary": format_text(summary),
+        "decisions": format_list(remove_duplicates(decisions)[:10], "decision"),
+        "action_items": format_list(remove_duplicates(action_items)[:15], "action item"),
+        "deadlines": format_list(remove_duplicates(deadlines)[:10], "deadline")
+    }
+    _store_cached_minutes(cleaned_text, minutes)
+    return minutes, full_text
+
+def generate_summary(text, sentences=None):
     if not text.strip():
         return "No summary available."
     
-    sentences = sent_tokenize(text) if NLTK_AVAILABLE else re.split(r'(?<=[.!?])\s+', text)
+    if sentences is None:
+        sentences = _split_sentences(text)
     cleaned_sentences = [s.strip() for s in sentences if len(s.strip()) > 10]
     
     if not cleaned_sentences:
         return text[:300] + "..." if len(text) > 300 else text
     
-    scored_sentences = []
-    for idx, sentence in enumerate(cleaned_sentences):
-        score = calculate_sentence_importance(sentence, idx, len(cleaned_sentences))
-        scored_sentences.append((score, sentence))
-    
-    scored_sentences.sort(reverse=True, key=lambda x: x[0])
-    num_sentences = min(max(3, len(cleaned_sentences) // 10), 8)
-    top_sentences = [s[1] for s in scored_sentences[:num_sentences]]
+    total = len(cleaned_sentences)
+    num_sentences = min(max(3, total // 10), 8)
+    top = heapq.nlargest(
+        num_sentences,
+        enumerate(cleaned_sentences),
+        key=lambda item: calculate_sentence_importance(item[1], item[0], total, item[1].lower())
+    )
+    top_sentences = {sentence for _, sentence in top}
     
     ordered_summary_sentences = [s for s in cleaned_sentences if s in top_sentences]
     summary = " ".join(ordered_summary_sentences)
     
     return summary + '.' if summary and not summary.endswith(('.', '!', '?')) else summary
 
-def calculate_sentence_importance(sentence, position, total_sentences):
-    score = 0.0
-    sentence_lower = sentence.lower()
+def calculate_sentence_importance(sentence, position, total_sentences, sentence_lower=None):
+    if sentence_lower is None:
+        sentence_lower = sentence.lower()
     
-    important_keywords = [
-        'decided', 'agreed', 'concluded', 'will', 'should', 'must',
-        'important', 'critical', 'key', 'main', 'primary',
-        'action', 'deadline', 'by', 'before', 'need to', 'have to',
-        'summary', 'conclusion', 'result', 'outcome',
-        'goal', 'objective', 'priority', 'focus'
-    ]
+    # Each keyword scores once, however often it occurs
+    if _KEYWORD_AUTOMATON is not None:
+        keyword_hits = len({keyword for _, keyword in _KEYWORD_AUTOMATON.iter(sentence_lower)})
+    else:
+        keyword_hits = sum(1 for keyword in _IMPORTANT_KEYWORDS if keyword in sentence_lower)
+    
+    word_count = len(sentence.split())
+    has_digit = _DIGIT_RE.search(sentence) is not None
     
-    for keyword in important_keywords:
-        if keyword in sentence_lower:
-            score += 1.0
+    return _score_sentence(keyword_hits, position, total_sentences, word_count, has_digit)
+
+def _score_sentence(keyword_hits, position, total_sentences, word_count, has_digit):
+    score = 1.0 * keyword_hits
     
     if position < 3:
         score += 2.0
     if position >= total_sentences - 3:
         score += 1.5
     
-    word_count = len(sentence.split())
     if 10 <= word_count <= 30:
         score += 1.0
     elif word_count < 5:
         score -= 2.0
     
-    if re.search(r'\d', sentence):
+    if has_digit:
         score += 0.5
     
     return score
 
-def extract_decisions(text):
+def extract_decisions(sentences, sentences_lower=None):
     decisions = []
-    sentences = sent_tokenize(text) if NLTK_AVAILABLE else re.split(r'(?<=[.!?])\s+', text)
-    
-    decision_patterns = [
-        r'\b(decided|agreed|concluded|determined|resolved|settled)\b',
-        r'\b(we will|we\'ll|let\'s|we should|we must)\b',
-        r'\b(approved|accepted|confirmed|finalized|committed to)\b',
-        r'\b(going with|moving forward with|proceeding with)\b',
-        r'\b(final decision|unanimous|consensus|voted to)\b',
-        r'\b(decision:|conclusion:)\s*',
-        r'\b(plan to|going to|will be|shall)\b',
-        r'\b(selected|chose|picked|opted for)\b',
-        r'\b(scheduled|arranged|organized)\b',
-        r'\b(changed|updated|modified)\b',
-        r'\b(adopted|implemented|established)\b',
-    ]
+    if sentences_lower is None:
+        sentences_lower = [s.lower() for s in sentences]
     
     decision_indicators = [
         'decide', 'agree', 'conclude', 'determine', 'resolve', 'settle',
@@ -130,37 +375,26 @@ def extract_decisions(text):
         'established', 'consensus', 'majority', 'unanimous'
     ]
     
-    for sentence in sentences:
-        for pattern in decision_patterns:
-            if re.search(pattern, sentence.lower()):
-                cleaned = clean_text(sentence)
-                if cleaned and len(cleaned.split()) >= 5:
-                    decisions.append(cleaned)
-                    break
-        
-        else:
-            if any(indicator in sentence.lower() for indicator in decision_indicators):
-                cleaned = clean_text(sentence)
-                if cleaned and len(cleaned.split()) >= 5:
-                    decisions.append(cleaned)
+    hits = _matching_sentences(sentences, _DECISION_PATTERNS, _DECISION_DB)
+    
+    for idx, sentence in enumerate(sentences):
+        if idx in hits or any(indicator in sentences_lower[idx] for indicator in decision_indicators):
+            cleaned = clean_text(sentence)
+            if cleaned and len(cleaned.split()) >= 5:
+                decisions.append(cleaned)
     
     return remove_duplicates(decisions)[:10]
 
-def extract_action_items(text):
+def extract_action_items(sentences):
     action_items = []
-    sentences = sent_tokenize(text) if NLTK_AVAILABLE else re.split(r'(?<=[.!?])\s+', text)
     
-    action_patterns = [
-        r'([A-Z][a-z]+(?:\s+[A-Z][a-z]+)?)\s+(?:will|should|needs? to|has to|must|is going to)\s+([^.!?]{10,})',
-        r'([A-Z][a-z]+(?:\s+[A-Z][a-z]+)?)\s+(?:is|will be)\s+(?:responsible for|in charge of|handling)\s+([^.!?]{10,})',
-        r'(?:action item|task|todo|to-do|assignment):\s*([^.!?]{10,})',
-        r'(?:please|can you|could you|would you)\s+([^.!?]{10,})',
-        r'\b(?:we|someone|somebody)\s+(?:need to|have to|must|should)\s+([^.!?]{10,})',
-    ]
+    hits = _matching_sentences(sentences, _ACTION_PATTERNS, _ACTION_DB)
     
-    for sentence in sentences:
-        for pattern in action_patterns:
-            matches = re.finditer(pattern, sentence, re.IGNORECASE)
+    for idx, sentence in enumerate(sentences):
+        if idx not in hits:
+            continue
+        for pattern in _ACTION_PATTERNS:
+            matches = pattern.finditer(sentence)
             for match in matches:
                 if len(match.groups()) >= 2:
                     action_item = f"{match.group(1).strip()}: {match.group(2).strip()}"
@@ -175,87 +409,43 @@ def extract_action_items(text):
     
     return remove_duplicates(action_items)[:15]
 
-def extract_deadlines(text):
+def extract_deadlines(sentences, sentences_lower=None):
     deadlines = []
-    sentences = sent_tokenize(text) if NLTK_AVAILABLE else re.split(r'(?<=[.!?])\s+', text)
+    if sentences_lower is None:
+        sentences_lower = [s.lower() for s in sentences]
     
-    # Enhanced deadline patterns with specific dates and times
-    deadline_patterns = [
-        # Original patterns
-        r'(?:by|before|until|no later than|due)\s+([A-Z][a-z]+day(?:\s+\w+)*|(?:the\s+)?\d{1,2}(?:st|nd|rd|th)?(?:\s+of)?\s+\w+|\d{1,2}/\d{1,2})',
-        r'(?:deadline|due date)(?:\s+is)?:?\s+([\w\s,]+)',
-        r'(?:complete|finish|submit|deliver|send)\s+(?:by|before)\s+([\w\s,]+)',
-        r'\b(tomorrow|today|tonight|this week|next week|this month|next month|end of (?:week|month|quarter|year))\b',
-        r'(?:in|within)\s+(\d+\s+(?:days?|weeks?|months?))',
-        
-        # NEW PATTERNS FOR SPECIFIC DATES
-        # Date formats: DD/MM/YYYY, DD-MM-YYYY, MM/DD/YYYY
-        r'\b\d{1,2}[/-]\d{1,2}[/-]\d{2,4}\b',
-        # Date formats: Month DD, YYYY (e.g., May 18, 2025)
-        r'\b(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]* \d{1,2}(?:st|nd|rd|th)?,? \d{4}\b',
-        # Date formats: DD Month YYYY (e.g., 18 May 2025)
-        r'\b\d{1,2}(?:st|nd|rd|th)? (?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]* \d{4}\b',
-        
-        # NEW PATTERNS FOR TIMES
-        # Time formats: HH:MM (e.g., 5:00, 17:30)
-        r'\b\d{1,2}:\d{2}\b',
-        # Time formats: HH:MM AM/PM (e.g., 5:00 PM)
-        r'\b\d{1,2}:\d{2}\s*(?:AM|PM|am|pm)\b',
-        
-        # COMBINED DATE AND TIME
-        # Date and time together (e.g., 18/5/2025 at 5:00)
-        r'\b\d{1,2}[/-]\d{1,2}[/-]\d{2,4}\s+(?:at\s+)?\d{1,2}:\d{2}(?:\s*(?:AM|PM|am|pm))?\b',
-        # Month DD, YYYY at HH:MM (e.g., May 18, 2025 at 5:00 PM)
-        r'\b(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]* \d{1,2}(?:st|nd|rd|th)?,? \d{4}\s+(?:at\s+)?\d{1,2}:\d{2}(?:\s*(?:AM|PM|am|pm))?\b',
-    ]
+    # Only sentences mentioning a time indicator are matched against the patterns
+    candidates = [idx for idx, lower in enumerate(sentences_lower) if _TIME_INDICATOR_RE.search(lower)]
+    hits = _matching_sentences([sentences[idx] for idx in candidates], [_DEADLINE_ANY], _DEADLINE_DB)
     
-    # Expanded time indicators
-    time_indicators = [
-        'deadline', 'due', 'by', 'before', 'until', 'asap', 'urgent',
-        'priority', 'immediately', 'soon', 'quickly', 'tomorrow', 'today',
-        'week', 'month', 'quarter', 'year',
-        # NEW INDICATORS
-        'at', 'on', 'date', 'time', 'schedule', 'appointment'
-    ]
-    
-    for sentence in sentences:
-        if any(indicator in sentence.lower() for indicator in time_indicators):
-            for pattern in deadline_patterns:
-                if re.search(pattern, sentence, re.IGNORECASE):
-                    cleaned = clean_text(sentence)
-                    if cleaned and len(cleaned.split()) >= 3:
-                        deadlines.append(cleaned)
-                        break
+    for pos in sorted(hits):
+        cleaned = clean_text(sentences[candidates[pos]])
+        if cleaned and len(cleaned.split()) >= 3:
+            deadlines.append(cleaned)
     
     return remove_duplicates(deadlines)[:10]
 
 def clean_text(text):
-    text = re.sub(r'\s+', ' ', text).strip()
-    text = re.sub(r'^\[?\d+:\d+:\d+\]?\s*', '', text)
-    text = re.sub(r'^SPEAKER_\d+:\s*', '', text, flags=re.IGNORECASE)
-    text = re.sub(r'^[A-Z\s]+:\s*', '', text)
-    text = re.sub(r'^\[\d+\.\d+-\d+\.\d+\]\s*', '', text)
+    text = _CLEAN_WS.sub(' ', text).strip()
+    text = _CLEAN_LEAD.sub('', text, count=1)
     
     if text:
-        text = text[0].upper() + text[1:] if len(text) > 1 else text.upper()
+        text = text[:1].upper() + text[1:]
     
-    return text + '.' if text and not re.search(r'[.!?]$', text) else text
+    return text + '.' if text and not text.endswith(('.', '!', '?')) else text
 
 def remove_duplicates(items):
-    seen = set()
-    unique_items = []
+    # dict keeps insertion order; setdefault keeps the first item per key
+    unique_items = {}
     for item in items:
-        key = item.lower().strip()[:50]
-        if key not in seen:
-            seen.add(key)
-            unique_items.append(item)
-    return unique_items
+        unique_items.setdefault(item.lower().strip()[:50], item)
+    return list(unique_items.values())
 
 def format_text(text):
     if not text or text.strip() in ["No summary available.", "No transcript text provided."]:
         return "No summary available."
     
-    text = re.sub(r'\s+', ' ', text).strip()
+    text = _CLEAN_WS.sub(' ', text).strip()
     return text + '.' if text and not text.endswith(('.', '!', '?')) else text
 
 def format_list(items, item_type):
@@ -1,27 +1,122 @@
 import os
+
+# Split the cores between files transcribed at once (the app's JOB_WORKERS) so
+# each file's model, numpy and ffmpeg threads don't oversubscribe the machine:
+# parallel files x intra-file threads ~= cpu count. This must run before numpy
+# (OpenBLAS) and the model runtimes load, since they read OMP_NUM_THREADS once.
+_MAX_PARALLEL_FILES = max(1, int(os.environ.get('JOB_WORKERS', 2)))
+_INTRA_THREADS = max(1, (os.cpu_count() or 1) // _MAX_PARALLEL_FILES)
+os.environ.setdefault('OMP_NUM_THREADS', str(_INTRA_THREADS))
+
+import json
+import hashlib
 import logging
 import subprocess
 import shutil  
-import whisper
+import tempfile
+import numpy as np
+import importlib.util
 import warnings
 import time
+import wave
+import queue
 import threading
+import functools
+from array import array
+from bisect import bisect_right
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+
+try:
+    import av
+    AV_AVAILABLE = True
+except ImportError:
+    AV_AVAILABLE = False
+
+try:
+    import soxr
+    SOXR_AVAILABLE = True
+except ImportError:
+    SOXR_AVAILABLE = False
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import xxhash
+    XXHASH_AVAILABLE = True
+except ImportError:
+    XXHASH_AVAILABLE = False
+
+# faster-whisper and ctranslate2 are imported where a model is needed, so importing
+# this module (e.g. for check_dependencies) doesn't pay for loading them
+WHISPER_AVAILABLE = importlib.util.find_spec("faster_whisper") is not None
 
 warnings.filterwarnings('ignore')
 logger = logging.getLogger(__name__)
 
+SAMPLE_RATE = 16000
+
 _model_cache = {}
 _model_lock = threading.Lock()
+_model_load_locks = {}
+
+# Where converted CTranslate2 models are stored, so later starts load them from
+# disk (default: the Hugging Face cache); device and compute type can be pinned
+WHISPER_MODEL_DIR = os.environ.get('WHISPER_MODEL_DIR') or None
+WHISPER_DEVICE = os.environ.get('WHISPER_DEVICE') or None
+WHISPER_COMPUTE_TYPE = os.environ.get('WHISPER_COMPUTE_TYPE') or None
+
+# Transcripts are cached on disk by audio content hash, model size and language
+TRANSCRIPT_CACHE_DIR = os.environ.get('TRANSCRIPT_CACHE_DIR', os.path.join('cache', 'transcripts'))
+
+def _pick_device():
+    import ctranslate2
+    return "cuda" if ctranslate2.get_cuda_device_count() > 0 else "cpu"
+
+def _pick_compute_type(device):
+    # int8 weights with fp16 activations need tensor cores (compute capability >= 7.0);
+    # plain fp16 for older GPUs; int8 on CPU
+    if device == "cuda":
+        import ctranslate2
+        supported = ctranslate2.get_supported_compute_types("cuda")
+        for compute_type in ("int8_float16", "float16"):
+            if compute_type in supported:
+                return compute_type
+        return "float32"
+    return "int8"
 
 def get_whisper_model(model_size="base"):
     global _model_cache, _model_lock
     
+    # Lock-free once loaded; dict.get is atomic under the GIL
+    model = _model_cache.get(model_size)
+    if model is not None:
+        return model
+    
+    # One lock per size, so different models can load at the same time
     with _model_lock:
+        load_lock = _model_load_locks.setdefault(model_size, threading.Lock())
+    
+    with load_lock:
         if model_size not in _model_cache:
             logger.info(f"Loading Whisper model '{model_size}'...")
             try:
+                from faster_whisper import WhisperModel
                 start_time = time.time()
-                _model_cache[model_size] = whisper.load_model(model_size)
+                device = WHISPER_DEVICE or _pick_device()
+                compute_type = WHISPER_COMPUTE_TYPE or _pick_compute_type(device)
+                _model_cache[model_size] = WhisperModel(
+                    model_size,
+                    device=device,
+                    compute_type=compute_type,
+                    cpu_threads=_INTRA_THREADS,
+                    download_root=WHISPER_MODEL_DIR
+                )
+                logger.info(f"Using {device} with {compute_type} weights")
                 load_time = time.time() - start_time
                 logger.info(f"Model loaded in {load_time:.2f} seconds")
             except Exception as e:
@@ -30,7 +125,96 @@ def get_whisper_model(model_size="base"):
         
         return _model_cache[model_size]
 
-def convert_audio_to_wav(input_path, output_dir="temp_audio"):
+def _pcm_pipe_command(input_path, speed_up=False):
+    cmd = ['ffmpeg', '-nostdin', '-v', 'error', '-threads', str(_INTRA_THREADS), '-i', input_path]
+    if speed_up:
+        cmd += ['-filter:a', 'atempo=2.0']
+    return cmd + ['-f', 'f32le', '-ac', '1', '-ar', str(SAMPLE_RATE), 'pipe:1']
+
+def _read_tail(f, size=4096):
+    # The end of ffmpeg's stderr is enough to say what went wrong
+    f.seek(0, os.SEEK_END)
+    f.seek(max(0, f.tell() - size))
+    return f.read()
+
+def _stream_chunks(input_path, chunk_sec=30, speed_up=False):
+    """Yield 16 kHz mono float32 chunks of chunk_sec seconds while ffmpeg is still decoding."""
+    chunk_bytes = chunk_sec * SAMPLE_RATE * 4
+    # stderr goes to a file for the same reason as in decode_audio_to_array
+    with tempfile.TemporaryFile() as errors:
+        try:
+            proc = subprocess.Popen(_pcm_pipe_command(input_path, speed_up), stdout=subprocess.PIPE,
+                                    stderr=errors, bufsize=1024 * 1024)
+        except FileNotFoundError:
+            raise Exception("ffmpeg not found. Please install ffmpeg and add it to PATH.")
+
+        with proc:
+            while True:
+                data = proc.stdout.read(chunk_bytes)
+                if not data:
+                    break
+                yield np.frombuffer(data, dtype=np.float32, count=len(data) // 4)
+
+        stderr = _read_tail(errors)
+
+    if proc.returncode != 0:
+        raise Exception(f"ffmpeg decoding failed: {stderr.decode(errors='replace')}")
+
+def decode_audio_to_array(input_path, speed_up=False):
+    """Decode audio to 16 kHz mono float32 samples in memory.
+
+    ffmpeg writes raw PCM to a pipe, so no intermediate WAV file is written or
+    read back. speed_up applies the same 2x atempo filter as convert_audio_to_wav.
+    """
+    logger.info(f"Decoding {input_path}...")
+    cmd = _pcm_pipe_command(input_path, speed_up)
+
+    # Size the buffer from the probed duration, so it rarely has to grow
+    duration = _get_audio_duration(input_path) / (2 if speed_up else 1)
+    buf = bytearray((int(duration * SAMPLE_RATE) + SAMPLE_RATE) * 4)
+    view = memoryview(buf)
+    offset = 0
+
+    # stderr goes to a file: a pipe read only after stdout's EOF would deadlock
+    # once ffmpeg writes more errors than the pipe buffer holds
+    with tempfile.TemporaryFile() as errors:
+        try:
+            proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=errors, bufsize=1024 * 1024)
+        except FileNotFoundError:
+            raise Exception("ffmpeg not found. Please install ffmpeg and add it to PATH.")
+
+        with proc:
+            while True:
+                if offset == len(buf):
+                    view.release()
+                    buf.extend(bytes(len(buf)))
+                    view = memoryview(buf)
+                read = proc.stdout.readinto(view[offset:])
+                if not read:
+                    break
+                offset += read
+            view.release()
+
+        stderr = _read_tail(errors)
+
+    if proc.returncode != 0:
+        raise Exception(f"ffmpeg decoding failed: {stderr.decode(errors='replace')}")
+
+    audio = np.frombuffer(buf, dtype=np.float32, count=offset // 4)
+    if audio.size == 0:
+        raise Exception("Decoding failed - no audio samples")
+    return audio
+
+def convert_audio_to_wav(input_path, output_dir="temp_audio", speed_up=False):
+    """Convert audio to 16 kHz mono WAV.
+
+    Deprecated for local transcription, which takes the samples from
+    decode_audio_to_array directly; kept for callers that need a file.
+
+    With speed_up, ffmpeg's atempo filter plays the audio at 2x, which halves
+    the work Whisper does at a small accuracy cost on normally paced speech.
+    Segment timestamps are then relative to the sped-up audio.
+    """
     if not os.path.exists(output_dir):
         os.makedirs(output_dir)
 
@@ -41,29 +225,20 @@ def convert_audio_to_wav(input_path, output_dir="temp_audio"):
     try:
         logger.info(f"Converting {input_path} to WAV...")
         
-        if input_path.lower().endswith('.wav'):
-            try:
-                result = subprocess.run(
-                    ['ffprobe', '-v', 'error', '-select_streams', 'a:0',
-                     '-show_entries', 'stream=sample_rate,channels',
-                     '-of', 'default=noprint_wrappers=1:nokey=1', input_path],
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.PIPE,
-                    text=True
-                )
-                output_lines = result.stdout.strip().split('\n')
-                if len(output_lines) >= 2:
-                    sample_rate = int(output_lines[0])
-                    channels = int(output_lines[1])
-                    
-                    if sample_rate == 16000 and channels == 1:
-                        shutil.copy2(input_path, output_wav_path)  # Now this will work
-                        return output_wav_path
-            except Exception:
-                pass
-        
-        cmd = [
-            'ffmpeg', '-i', input_path,
+        if input_path.lower().endswith('.wav') and not speed_up:
+            info = _probe(input_path)
+            if info["sample_rate"] == 16000 and info["channels"] == 1:
+                shutil.copy2(input_path, output_wav_path)
+                return output_wav_path
+        
+        # Resample in-process when possible; atempo still needs ffmpeg
+        if not speed_up and _convert_with_soxr(input_path, output_wav_path):
+            return output_wav_path
+        
+        cmd = ['ffmpeg', '-threads', str(_INTRA_THREADS), '-i', input_path]
+        if speed_up:
+            cmd += ['-filter:a', 'atempo=2.0']
+        cmd += [
             '-ar', '16000',
             '-ac', '1',
             '-c:a', 'pcm_s16le',
@@ -87,71 +262,477 @@ def convert_audio_to_wav(input_path, output_dir="temp_audio"):
         logger.error(f"Error converting audio: {e}")
         raise
 
-def transcribe_audio(audio_path, model_size="base", language="en", max_duration=None):
+def _convert_with_soxr(input_path, output_wav_path):
+    """Decode with PyAV and resample with libsoxr, writing 16-bit PCM with wave.
+
+    Returns False when either library is missing or the file can't be decoded,
+    so the caller can fall back to ffmpeg.
+    """
+    if not (AV_AVAILABLE and SOXR_AVAILABLE):
+        return False
+
     try:
-        logger.info(f"Transcribing {os.path.basename(audio_path)}")
-        
-        if not os.path.exists(audio_path):
-            raise FileNotFoundError(f"Audio file not found: {audio_path}")
+        with av.open(input_path) as container, wave.open(output_wav_path, 'wb') as out:
+            stream = container.streams.audio[0]
+            in_rate = stream.sample_rate
+            # PyAV only converts sample format and downmixes; the rate change is soxr's
+            to_mono = av.AudioResampler(format='flt', layout='mono', rate=in_rate)
+            resampler = soxr.ResampleStream(in_rate, SAMPLE_RATE, 1, dtype='float32', quality='HQ')
+
+            out.setnchannels(1)
+            out.setsampwidth(2)
+            out.setframerate(SAMPLE_RATE)
+
+            def write(samples, last=False):
+                samples = resampler.resample_chunk(samples, last=last)
+                pcm = np.clip(samples * 32768.0, -32768, 32767).astype('<i2')
+                out.writeframes(pcm.tobytes())
+
+            for frame in container.decode(stream):
+                for mono in to_mono.resample(frame):
+                    write(mono.to_ndarray()[0])
+            for mono in to_mono.resample(None):
+                write(mono.to_ndarray()[0])
+            write(np.zeros(0, dtype=np.float32), last=True)
+    except Exception as e:
+        logger.warning(f"In-process conversion failed, falling back to ffmpeg: {e}")
+        return False
+
+    return os.path.getsize(output_wav_path) >= 1000
+
+@dataclass
+class Segments:
+    """Transcript segments stored column-wise: start/end times as arrays, texts as a list."""
+    starts: np.ndarray = field(default_factory=lambda: np.zeros(0))
+    ends: np.ndarray = field(default_factory=lambda: np.zeros(0))
+    texts: list = field(default_factory=list)
+
+    @classmethod
+    def from_dicts(cls, segments):
+        starts = np.empty(len(segments))
+        ends = np.empty(len(segments))
+        texts = []
+        for i, segment in enumerate(segments):
+            starts[i] = segment["start"]
+            ends[i] = segment["end"]
+            texts.append(segment["text"])
+        return cls(starts, ends, texts)
+
+    def between(self, t0, t1):
+        """Segments that lie entirely within [t0, t1]."""
+        mask = (self.starts >= t0) & (self.ends <= t1)
+        return Segments(self.starts[mask], self.ends[mask], [t for t, keep in zip(self.texts, mask) if keep])
+
+    def as_dict_list(self):
+        return list(self)
+
+    def __len__(self):
+        return len(self.texts)
+
+    def __iter__(self):
+        for start, end, text in zip(self.starts.tolist(), self.ends.tolist(), self.texts):
+            yield {"start": start, "end": end, "text": text}
+
+def transcribe_audio(audio, model_size="base", language="en", max_duration=None):
+    # Fill the columns straight from the model's rows, without per-segment dicts
+    starts = array('d')
+    ends = array('d')
+    texts = []
+    for start, end, text in _iter_segment_rows(audio, model_size, language, max_duration):
+        starts.append(start)
+        ends.append(end)
+        texts.append(text)
+    return Segments(np.array(starts, dtype=np.float64), np.array(ends, dtype=np.float64), texts)
+
+def iter_transcribe_audio(audio, model_size="base", language="en", max_duration=None):
+    """Yield transcript segments one at a time, in the shape of Segments.as_dict_list() items.
+
+    audio is either a file path or 16 kHz mono float32 samples as returned by
+    decode_audio_to_array.
+    """
+    for start, end, text in _iter_segment_rows(audio, model_size, language, max_duration):
+        yield {"start": start, "end": end, "text": text}
+
+def _iter_segment_rows(audio, model_size, language, max_duration):
+    # (start, end, text) tuples for transcribe_audio and iter_transcribe_audio
+    container = None
+    samples = None
+    try:
+        if isinstance(audio, np.ndarray):
+            logger.info(f"Transcribing {audio.size / SAMPLE_RATE:.1f}s of decoded audio")
+            
+            # Same threshold as the file check below: under ~1000 bytes of 16-bit PCM
+            if audio.size < 500:
+                yield (0.0, 1.0, "Audio file too short")
+                return
+            
+            duration = audio.size / SAMPLE_RATE
+        else:
+            logger.info(f"Transcribing {os.path.basename(audio)}")
+            
+            try:
+                st = os.stat(audio)
+            except FileNotFoundError:
+                raise FileNotFoundError(f"Audio file not found: {audio}")
+            
+            if st.st_size < 1000:
+                yield (0.0, 1.0, "Audio file too short")
+                return
+            
+            # Already 16 kHz mono 16-bit PCM (e.g. from convert_audio_to_wav): take
+            # the samples as they are instead of decoding the file again
+            samples = _read_wav16k_mono(audio) if audio.lower().endswith('.wav') else None
+            if samples is not None:
+                duration = samples.size / SAMPLE_RATE
+            else:
+                # One open serves both the duration and, on a cache miss, the decode
+                container = _open_container(audio)
+                if container is not None and container.duration is not None:
+                    duration = float(container.duration) / av.time_base
+                else:
+                    duration = _get_audio_duration(audio)
         
-        file_size = os.path.getsize(audio_path)
-        if file_size < 1000:
-            return [{"start": 0.0, "end": 1.0, "text": "Audio file too short"}]
+        if max_duration and duration > max_duration:
+            logger.warning(f"Audio exceeds max duration ({duration}s > {max_duration}s)")
         
-        try:
-            duration = _get_audio_duration(audio_path)
-            if max_duration and duration > max_duration:
-                logger.warning(f"Audio exceeds max duration ({duration}s > {max_duration}s)")
-        except Exception:
-            pass
+        cache_path = _transcript_cache_path(audio, model_size, language)
+        cached = _load_cached_transcript(cache_path)
+        if cached is not None:
+            logger.info("Transcript cache hit")
+            yield from cached
+            return
         
         model = get_whisper_model(model_size)
         
+        if samples is not None:
+            audio = samples
+        elif container is not None:
+            audio = _decode_container(container)
+        
         start_time = time.time()
-        result = model.transcribe(
-            audio_path,
-            language=language if language != "auto" else None,
-            verbose=False,
-            word_timestamps=False,
-            fp16=False,
-            temperature=0.0,
-        )
+        rows = []
+        for row in _run_model(model, audio, language):
+            rows.append(row)
+            yield row
+        
+        if not rows:
+            rows.append((0.0, 1.0, "No speech detected"))
+            yield rows[0]
+        
         transcription_time = time.time() - start_time
         logger.info(f"Transcription completed in {transcription_time:.2f}s")
         
-        segments = []
-        if "segments" in result and result["segments"]:
-            for segment in result["segments"]:
-                text = segment["text"].strip()
-                if text:
-                    segments.append({
-                        "start": float(segment["start"]),
-                        "end": float(segment["end"]),
-                        "text": text
-                    })
-        elif "text" in result and result["text"].strip():
-            segments.append({
-                "start": 0.0,
-                "end": duration if 'duration' in locals() else 10.0,
-                "text": result["text"].strip()
-            })
-        else:
-            segments.append({"start": 0.0, "end": 1.0, "text": "No speech detected"})
-        
-        return segments
+        _store_cached_transcript(cache_path, rows)
         
     except Exception as e:
         logger.error(f"Transcription failed: {e}")
-        return [{"start": 0.0, "end": 1.0, "text": f"Transcription failed: {str(e)}"}]
+        yield (0.0, 1.0, f"Transcription failed: {str(e)}")
+    finally:
+        if container is not None:
+            container.close()
 
-def _get_audio_duration(audio_path):
+def _read_wav16k_mono(path):
+    """Read a 16 kHz mono 16-bit PCM WAV as float32 samples, or None for any other format."""
     try:
-        cmd = ['ffprobe', '-v', 'error', '-show_entries', 'format=duration',
-               '-of', 'default=noprint_wrappers=1:nokey=1', audio_path]
-        result = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
-        return float(result.stdout.strip())
+        with wave.open(path, 'rb') as f:
+            if f.getframerate() != SAMPLE_RATE or f.getnchannels() != 1 or f.getsampwidth() != 2:
+                return None
+            frames = f.readframes(f.getnframes())
+    except (wave.Error, EOFError):
+        return None
+    # Cast then multiply by the reciprocal, cheaper than dividing
+    return np.frombuffer(frames, dtype='<i2').astype(np.float32) * np.float32(1.0 / 32768.0)
+
+def _open_container(audio_path):
+    if not AV_AVAILABLE:
+        return None
+    try:
+        return av.open(audio_path)
+    except Exception:
+        return None
+
+def _decode_container(container):
+    """Decode the first audio stream of an open container to 16 kHz mono float32."""
+    resampler = av.AudioResampler(format='flt', layout='mono', rate=SAMPLE_RATE)
+    chunks = []
+    for frame in container.decode(container.streams.audio[0]):
+        for mono in resampler.resample(frame):
+            chunks.append(mono.to_ndarray()[0])
+    for mono in resampler.resample(None):
+        chunks.append(mono.to_ndarray()[0])
+    return np.concatenate(chunks) if chunks else np.zeros(0, dtype=np.float32)
+
+def transcribe_batch(paths, model_size="base", language="en", max_workers=None):
+    """Transcribe several files, decoding upcoming files while the current one is transcribed.
+
+    Returns one Segments per path, in the same order as paths.
+    """
+    max_workers = max_workers or max(1, (os.cpu_count() or 2) // 2)
+    # Bounded, so decoding stays at most a few files ahead of transcription
+    decoded = queue.Queue(maxsize=4)
+    
+    def produce(pool):
+        for path in paths:
+            decoded.put(pool.submit(decode_audio_to_array, path))
+        decoded.put(None)
+    
+    results = []
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        producer = threading.Thread(target=produce, args=(pool,), daemon=True)
+        producer.start()
+        
+        # The model is shared, so files are transcribed one after another
+        while True:
+            future = decoded.get()
+            if future is None:
+                break
+            try:
+                audio = future.result()
+            except Exception as e:
+                logger.error(f"Decoding failed: {e}")
+                results.append(Segments.from_dicts([{"start": 0.0, "end": 1.0, "text": f"Transcription failed: {str(e)}"}]))
+                continue
+            results.append(transcribe_audio(audio, model_size, language))
+        
+        producer.join()
+    
+    return results
+
+def transcribe_batch_short(paths, model_size="base", language="en", batch_size=8, max_workers=None):
+    """Transcribe many short files with batched encoder/decoder calls.
+
+    The decoded files are laid end to end and each one (split into 30 s pieces
+    if longer) becomes a clip for faster-whisper's BatchedInferencePipeline, so
+    up to batch_size clips share one model call instead of one call per file.
+    Returns one Segments per path, in the same order as paths.
+    """
+    from faster_whisper import BatchedInferencePipeline
+    
+    max_workers = max_workers or max(1, (os.cpu_count() or 2) // 2)
+    failed = {}
+    decoded = []
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        futures = [pool.submit(decode_audio_to_array, path) for path in paths]
+    for i, future in enumerate(futures):
+        try:
+            decoded.append(future.result())
+        except Exception as e:
+            logger.error(f"Decoding failed: {e}")
+            failed[i] = f"Transcription failed: {str(e)}"
+            decoded.append(np.zeros(0, dtype=np.float32))
+    
+    # Where each file starts in the joined audio, and the clips covering it
+    offsets = []
+    clips = []
+    position = 0
+    for audio in decoded:
+        offsets.append(position / SAMPLE_RATE)
+        for start in range(0, audio.size, 30 * SAMPLE_RATE):
+            end = min(start + 30 * SAMPLE_RATE, audio.size)
+            clips.append({"start": (position + start) / SAMPLE_RATE, "end": (position + end) / SAMPLE_RATE})
+        position += audio.size
+    
+    per_file = [[] for _ in paths]
+    if clips:
+        try:
+            pipeline = BatchedInferencePipeline(model=get_whisper_model(model_size))
+            start_time = time.time()
+            result, info = pipeline.transcribe(
+                np.concatenate(decoded),
+                language=language if language != "auto" else None,
+                clip_timestamps=clips,
+                batch_size=batch_size,
+                beam_size=1,
+                temperature=0.0,
+            )
+            for segment in result:
+                text = segment.text.strip()
+                if text:
+                    # Map the segment back to its file by its midpoint; faster-whisper
+                    # rounds clip bounds to samples and times to 1 ms, so a start can
+                    # fall just before its file's exact offset
+                    i = bisect_right(offsets, (float(segment.start) + float(segment.end)) / 2) - 1
+                    per_file[i].append({
+                        "start": max(0.0, float(segment.start) - offsets[i]),
+                        "end": float(segment.end) - offsets[i],
+                        "text": text
+                    })
+            logger.info(f"Batched transcription of {len(paths)} files completed in {time.time() - start_time:.2f}s")
+        except Exception as e:
+            logger.error(f"Transcription failed: {e}")
+            return [Segments.from_dicts([{"start": 0.0, "end": 1.0, "text": f"Transcription failed: {str(e)}"}])
+                    for _ in paths]
+    
+    results = []
+    for i, segments in enumerate(per_file):
+        if i in failed:
+            segments = [{"start": 0.0, "end": 1.0, "text": failed[i]}]
+        elif not segments:
+            segments = [{"start": 0.0, "end": 1.0, "text": "No speech detected"}]
+        results.append(Segments.from_dicts(segments))
+    return results
+
+def iter_transcribe_stream(input_path, model_size="base", language="en", speed_up=False, chunk_sec=30):
+    """Like iter_transcribe_audio for a file, but transcribes while ffmpeg is still decoding.
+
+    The audio is fed to the model in chunk_sec windows with timestamps shifted by
+    each window's offset, so decoding overlaps transcription and memory stays at
+    one window regardless of meeting length.
+
+    Unlike iter_transcribe_audio, failures raise instead of being yielded as a
+    segment: the input is the raw upload, so a file ffmpeg can't decode, or one
+    that is too short, must fail the job rather than be summarized.
+    """
+    logger.info(f"Streaming {os.path.basename(input_path)}")
+    
+    if not os.path.exists(input_path):
+        raise FileNotFoundError(f"Audio file not found: {input_path}")
+    
+    # Keyed by the source file like iter_transcribe_audio, so the windowing and
+    # tempo are part of the key to keep the two result sets apart
+    variant = f"stream{chunk_sec}" + ("_x2" if speed_up else "")
+    cache_path = _transcript_cache_path(input_path, model_size, language, variant)
+    cached = _load_cached_transcript(cache_path)
+    if cached is not None:
+        logger.info("Transcript cache hit")
+        for start, end, text in cached:
+            yield {"start": start, "end": end, "text": text}
+        return
+    
+    model = get_whisper_model(model_size)
+    
+    start_time = time.time()
+    rows = []
+    offset = 0.0
+    for chunk in _stream_chunks(input_path, chunk_sec, speed_up):
+        if offset == 0.0 and chunk.size < 500:
+            raise Exception("Audio file too short")
+        for start, end, text in _run_model(model, chunk, language, offset):
+            rows.append((start, end, text))
+            yield {"start": start, "end": end, "text": text}
+        offset += chunk.size / SAMPLE_RATE
+    
+    if offset == 0.0:
+        raise Exception("Decoding failed - no audio samples")
+    
+    if not rows:
+        rows.append((0.0, 1.0, "No speech detected"))
+        yield {"start": 0.0, "end": 1.0, "text": "No speech detected"}
+    
+    logger.info(f"Transcription completed in {time.time() - start_time:.2f}s")
+    
+    _store_cached_transcript(cache_path, rows)
+
+def _run_model(model, audio, language, offset=0.0):
+    # Log-mel features are computed inside faster-whisper, once per call on the
+    # whole array; only the encoder/decoder run on the GPU
+    result, info = model.transcribe(
+        audio,
+        language=language if language != "auto" else None,
+        beam_size=1,
+        temperature=0.0,
+        vad_filter=False,
+        word_timestamps=False,
+    )
+    
+    # faster-whisper decodes lazily, so each segment is passed on as soon as it is ready
+    for segment in result:
+        text = segment.text.strip()
+        if text:
+            yield (float(segment.start) + offset, float(segment.end) + offset, text)
+
+def _transcript_cache_path(audio, model_size, language, variant=None):
+    # The hash only identifies cached audio, so prefer the much faster xxh3 over SHA-256
+    digest = xxhash.xxh3_128() if XXHASH_AVAILABLE else hashlib.sha256()
+    if isinstance(audio, np.ndarray):
+        digest.update(np.ascontiguousarray(audio))
+    else:
+        with open(audio, 'rb') as f:
+            for block in iter(lambda: f.read(1024 * 1024), b''):
+                digest.update(block)
+    name = f"{digest.hexdigest()}_{model_size}_{language}"
+    if variant:
+        name += f"_{variant}"
+    return os.path.join(TRANSCRIPT_CACHE_DIR, f"{name}.json")
+
+def _load_cached_transcript(cache_path):
+    """Return cached (start, end, text) rows, or None on a miss."""
+    try:
+        with open(cache_path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return None
+    # Entries are stored column-wise; older ones are a list of segment dicts
+    if isinstance(data, dict):
+        return list(zip(data["starts"], data["ends"], data["texts"]))
+    return [(segment["start"], segment["end"], segment["text"]) for segment in data]
+
+def _store_cached_transcript(cache_path, rows):
+    tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+    starts, ends, texts = zip(*rows) if rows else ((), (), ())
+    try:
+        os.makedirs(TRANSCRIPT_CACHE_DIR, exist_ok=True)
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({"starts": starts, "ends": ends, "texts": texts}, f)
+        os.replace(tmp_path, cache_path)
+    except OSError as e:
+        logger.warning(f"Could not write transcript cache: {e}")
+
+def _probe(audio_path):
+    """Return {'sample_rate', 'channels', 'duration'} for the first audio stream.
+
+    Values that can't be read are None. Results are cached per path and
+    modification time, so repeated probes of the same upload cost one stat.
+    """
+    try:
+        mtime_ns = os.stat(audio_path).st_mtime_ns
+    except OSError:
+        return {"sample_rate": None, "channels": None, "duration": None}
+    return _probe_cached(audio_path, mtime_ns)
+
+@functools.lru_cache(maxsize=256)
+def _probe_cached(audio_path, mtime_ns):
+    info = {"sample_rate": None, "channels": None, "duration": None}
+    
+    # Read the header in-process; spawning ffprobe costs more than the probe itself
+    if AV_AVAILABLE:
+        try:
+            with av.open(audio_path) as container:
+                stream = container.streams.audio[0]
+                info["sample_rate"] = stream.sample_rate
+                info["channels"] = stream.channels
+                if container.duration is not None:
+                    info["duration"] = float(container.duration) / av.time_base
+            return info
+        except Exception:
+            pass
+    
+    # A single ffprobe call covers the stream format and the duration
+    try:
+        result = subprocess.run(
+            ['ffprobe', '-v', 'error', '-select_streams', 'a:0',
+             '-show_entries', 'stream=sample_rate,channels,duration:format=duration',
+             '-of', 'json', audio_path],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE
+        )
+        data = orjson.loads(result.stdout) if ORJSON_AVAILABLE else json.loads(result.stdout)
+        streams = data.get("streams") or [{}]
+        stream = streams[0]
+        if stream.get("sample_rate"):
+            info["sample_rate"] = int(stream["sample_rate"])
+        if stream.get("channels"):
+            info["channels"] = int(stream["channels"])
+        duration = (data.get("format") or {}).get("duration") or stream.get("duration")
+        if duration:
+            info["duration"] = float(duration)
     except Exception:
-        return 10.0
+        pass
+    return info
+
+def _get_audio_duration(audio_path):
+    duration = _probe(audio_path)["duration"]
+    return duration if duration is not None else 10.0
 
 def check_dependencies():
     deps = {}
@@ -167,19 +748,33 @@ def check_dependencies():
     except FileNotFoundError:
         deps['ffprobe'] = False
     
-    try:
-        import whisper
-        deps['whisper'] = True
-    except ImportError:
-        deps['whisper'] = False
+    deps['whisper'] = WHISPER_AVAILABLE
     
     return deps
 
+def _warm_up_model(model_size):
+    model = get_whisper_model(model_size)
+    
+    # One pass over a second of silence, so the first real request doesn't pay for
+    # allocator and kernel setup; the segment generator must be drained to run it
+    try:
+        start_time = time.time()
+        segments, _ = model.transcribe(np.zeros(SAMPLE_RATE, dtype=np.float32), language="en", beam_size=1)
+        for _ in segments:
+            pass
+        logger.info(f"Warmed up {model_size} model in {time.time() - start_time:.2f} seconds")
+    except Exception as e:
+        logger.warning(f"Warm-up of {model_size} model failed: {e}")
+
 def preload_models():
     logger.info("Preloading Whisper models...")
-    for model_size in ["tiny", "base", "small"]:
+    model_sizes = ["tiny", "base", "small"]
+    # Independent downloads and loads, so run them side by side
+    with ThreadPoolExecutor(max_workers=len(model_sizes)) as pool:
+        futures = {pool.submit(_warm_up_model, size): size for size in model_sizes}
+    for future, model_size in futures.items():
         try:
-            get_whisper_model(model_size)
+            future.result()
             logger.info(f"Preloaded {model_size} model")
         except Exception as e:
-            logger.error(f"Failed to preload {model_size}: {e}")
\ No newline at end of file
+            logger.error(f"Failed to preload {model_size}: {e}")
@@ -0,0 +1,88 @@
+import os
+import time
+import logging
+import threading
+import functools
+import numpy as np
+import openvino_genai
+
+logger = logging.getLogger(__name__)
+
+# Compiled model blobs are kept here, so later starts on GPU/NPU skip recompiling
+OPENVINO_CACHE_DIR = os.environ.get('OPENVINO_CACHE_DIR') or os.path.expanduser(os.path.join('~', '.cache', 'whisper_ov'))
+
+_pipelines = {}
+_pipeline_lock = threading.Lock()
+
+# Listing devices loads the OpenVINO plugins, so do it once
+@functools.lru_cache(maxsize=None)
+def _pick_device():
+    try:
+        import openvino
+        devices = openvino.Core().available_devices
+    except Exception:
+        return "CPU"
+    return "GPU" if any(device.startswith("GPU") for device in devices) else "CPU"
+
+def get_openvino_pipeline(model_dir, device=None):
+    device = device or os.environ.get('OPENVINO_DEVICE') or _pick_device()
+    key = (model_dir, device)
+
+    pipeline = _pipelines.get(key)
+    if pipeline is not None:
+        return pipeline
+
+    with _pipeline_lock:
+        if key not in _pipelines:
+            logger.info(f"Loading OpenVINO Whisper pipeline from {model_dir} on {device}...")
+            start_time = time.time()
+            _pipelines[key] = openvino_genai.WhisperPipeline(model_dir, device, CACHE_DIR=OPENVINO_CACHE_DIR)
+            logger.info(f"Pipeline loaded in {time.time() - start_time:.2f} seconds")
+        return _pipelines[key]
+
+def transcribe_openvino(audio, model_dir=None, language="en", device=None):
+    """Transcribe 16 kHz mono float32 samples with an OpenVINO GenAI Whisper pipeline.
+
+    Returns segments in the same shape as core.transcriber_remote.transcribe_remote.
+    """
+    model_dir = model_dir or os.environ.get('OPENVINO_WHISPER_MODEL_DIR')
+    try:
+        if not model_dir:
+            raise ValueError("OpenVINO Whisper model directory not configured")
+
+        pipeline = get_openvino_pipeline(model_dir, device)
+
+        start_time = time.time()
+        options = {"return_timestamps": True}
+        if language != "auto":
+            options["language"] = f"<|{language}|>"
+        # The float32 array is copied straight into the pipeline's input; a Python
+        # list would hold a boxed float per sample
+        result = pipeline.generate(np.ascontiguousarray(audio, dtype=np.float32), **options)
+        logger.info(f"OpenVINO transcription completed in {time.time() - start_time:.2f}s")
+
+        return _result_to_segments(result)
+
+    except Exception as e:
+        logger.error(f"OpenVINO transcription failed: {e}")
+        return [{"start": 0.0, "end": 1.0, "text": f"Transcription failed: {str(e)}"}]
+
+def _result_to_segments(result):
+    segments = []
+    for chunk in getattr(result, "chunks", None) or []:
+        text = chunk.text.strip()
+        if text:
+            segments.append({
+                "start": float(chunk.start_ts),
+                "end": float(chunk.end_ts),
+                "text": text
+            })
+
+    if not segments:
+        text = " ".join(result.texts).strip()
+        if text:
+            segments.append({"start": 0.0, "end": 10.0, "text": text})
+        else:
+            segments.append({"start": 0.0, "end": 1.0, "text": "No speech detected"})
+
+    return segments
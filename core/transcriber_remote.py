@@ -0,0 +1,87 @@
+import os
+import time
+import logging
+import requests
+
+logger = logging.getLogger(__name__)
+
+REPLICATE_API_URL = "https://api.replicate.com/v1"
+
+def transcribe_remote(wav_path, api_token, version=None, poll_interval=2.0, timeout=3600):
+    """Transcribe audio with a hosted Whisper model on Replicate.
+
+    Returns a list of segment dicts, as core.transcriber.Segments.as_dict_list() does.
+    """
+    version = version or os.environ.get('REPLICATE_WHISPER_VERSION')
+    try:
+        if not api_token:
+            raise ValueError("Replicate API token not configured")
+        if not version:
+            raise ValueError("Replicate Whisper model version not configured")
+
+        logger.info(f"Transcribing {os.path.basename(wav_path)} on Replicate")
+        start_time = time.time()
+        headers = {"Authorization": f"Bearer {api_token}"}
+
+        # Upload the audio, then start a prediction on it
+        with open(wav_path, 'rb') as f:
+            response = requests.post(
+                f"{REPLICATE_API_URL}/files",
+                headers=headers,
+                files={"content": (os.path.basename(wav_path), f, "audio/wav")},
+                timeout=300
+            )
+        response.raise_for_status()
+        audio_url = response.json()["urls"]["get"]
+
+        response = requests.post(
+            f"{REPLICATE_API_URL}/predictions",
+            headers=headers,
+            json={"version": version, "input": {"audio": audio_url}},
+            timeout=30
+        )
+        response.raise_for_status()
+        prediction = response.json()
+
+        # Poll until the prediction finishes
+        while prediction["status"] not in ("succeeded", "failed", "canceled"):
+            if time.time() - start_time > timeout:
+                raise TimeoutError(f"Replicate prediction timed out after {timeout}s")
+            time.sleep(poll_interval)
+            response = requests.get(
+                f"{REPLICATE_API_URL}/predictions/{prediction['id']}",
+                headers=headers,
+                timeout=30
+            )
+            response.raise_for_status()
+            prediction = response.json()
+
+        if prediction["status"] != "succeeded":
+            raise Exception(f"Replicate prediction {prediction['status']}: {prediction.get('error')}")
+
+        logger.info(f"Remote transcription completed in {time.time() - start_time:.2f}s")
+        return _output_to_segments(prediction.get("output") or {})
+
+    except Exception as e:
+        logger.error(f"Remote transcription failed: {e}")
+        return [{"start": 0.0, "end": 1.0, "text": f"Transcription failed: {str(e)}"}]
+
+def _output_to_segments(output):
+    segments = []
+    for segment in output.get("segments") or []:
+        text = (segment.get("text") or "").strip()
+        if text:
+            segments.append({
+                "start": float(segment.get("start", 0.0)),
+                "end": float(segment.get("end", 0.0)),
+                "text": text
+            })
+
+    if not segments:
+        text = (output.get("transcription") or "").strip()
+        if text:
+            segments.append({"start": 0.0, "end": 10.0, "text": text})
+        else:
+            segments.append({"start": 0.0, "end": 1.0, "text": "No speech detected"})
+
+    return segments